@@ -4,20 +4,98 @@ FastAPI application for managing DVC experiments.
 Provides endpoints to list experiments, get parameters, and apply experiments.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict
-from typing import List, Optional, Dict
-import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import List, Optional, Dict, Tuple, Union
+import asyncio
+import functools
+import hashlib
 import json
-import re
+import os
 import sys
+import time
+
+try:
+    from dvc.exceptions import DvcException
+    from dvc.repo import Repo
+    from dvc.repo.experiments.exceptions import InvalidExpRevError, UnresolvedExpNamesError
+except ImportError:  # pragma: no cover - fall back to the dvc CLI
+    DvcException = None
+    Repo = None
+    InvalidExpRevError = UnresolvedExpNamesError = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the DVC repository once and share it across all requests."""
+    app.state.repo = None
+    # A single worker runs every Repo call, one at a time
+    app.state.repo_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dvc-repo')
+    loop = asyncio.get_running_loop()
+    if Repo is not None:
+        try:
+            app.state.repo = await loop.run_in_executor(app.state.repo_executor, Repo)
+        except Exception as e:
+            print(f"Could not open DVC repository, using the dvc CLI instead: {e}", file=sys.stderr)
+    
+    yield
+    
+    if app.state.repo is not None:
+        await loop.run_in_executor(app.state.repo_executor, app.state.repo.close)
+    app.state.repo_executor.shutdown()
+
 
 app = FastAPI(
     title="DVC Experiments API",
     description="API for managing DVC experiments: list, get parameters, and apply experiments",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
+)
+
+# Location of the experiment revisions in 'dvc exp show --json' output
+_EXP_SHOW_REVS_PREFIX = 'item.experiments.item.revs.item'
+
+# 'dvc exp apply' messages of InvalidExpRevError and UnresolvedExpNamesError
+_UNKNOWN_EXPERIMENT_ERRORS = (
+    'does not appear to be an experiment commit',
+    'is not a valid experiment name',
 )
 
+# Characters of a (short) git commit hash
+_HEX_DIGITS = frozenset('0123456789abcdef')
+
+# Most recently used params keyed on (commit_hash, git HEAD)
+PARAMS_CACHE_SIZE = 512
+
+_PARAMS_CACHE: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+
+# Seconds a parsed 'dvc exp list' result stays valid
+EXP_LIST_CACHE_TTL = 2
+
+# (timestamp, experiments, by_name, by_hash)
+_EXP_LIST_CACHE = (0, None, {}, {})
+
+# Lets concurrent cache misses share a single 'dvc exp list' run
+_EXP_LIST_LOCK = asyncio.Lock()
+
+# 'dvc exp list' and 'dvc exp apply' take DVC's repository lock and fail
+# right away if another dvc process holds it, so they are run one at a time
+_DVC_LOCK = asyncio.Lock()
+
 
 class ExperimentInfo(BaseModel):
     """Model for experiment information."""
@@ -41,100 +119,518 @@ class ApplyExperimentResponse(BaseModel):
     experiment_name: str
 
 
-def get_experiments_list() -> List[tuple]:
+def dump_json(content) -> bytes:
     """
-    Get list of DVC experiments using 'dvc exp list' command.
+    Serialize content to JSON bytes, with orjson if it is installed.
     
+    Args:
+        content: JSON-serializable data
+        
     Returns:
-        list: List of tuples (commit_hash, experiment_name)
+        bytes: UTF-8 encoded JSON
     """
-    try:
-        result = subprocess.run(
-            ['dvc', 'exp', 'list'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, separators=(',', ':')).encode()
+
+
+def load_json(data: bytes):
+    """
+    Parse JSON bytes, with orjson if it is installed.
+    
+    Args:
+        data: UTF-8 encoded JSON
         
-        experiments = []
-        lines = result.stdout.strip().split('\n')
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+async def run_command(*args: str, text: bool = True) -> Tuple[int, Union[str, bytes], str]:
+    """
+    Run a command without blocking the event loop.
+    
+    Args:
+        *args: Program and arguments to execute
+        text: Decode stdout; pass False to get the raw bytes, e.g. for load_json
         
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('main:'):
-                continue
-            
-            # Parse lines like: "ded11c0 [addle-hill]"
-            match = re.match(r'(\w+)\s+\[(.+)\]', line)
-            if match:
-                commit_hash = match.group(1)
-                exp_name = match.group(2)
-                experiments.append((commit_hash, exp_name))
+    Returns:
+        tuple: (returncode, stdout, stderr)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await proc.communicate()
+    finally:
+        # Don't leave the child running if the caller is cancelled
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+    if text:
+        stdout = stdout.decode()
+    return proc.returncode, stdout, stderr.decode('utf-8', 'replace')
+
+
+async def stream_command(args: Tuple[str, ...], consume):
+    """
+    Run a command and yield the items parsed from its output while it runs.
+    
+    Args:
+        args: Program and arguments to execute
+        consume: Function taking the stdout stream and returning an async
+            iterable of parsed items
         
-        return experiments
+    Yields:
+        Items produced by consume
         
-    except subprocess.CalledProcessError as e:
+    Raises:
+        HTTPException: 500 if the command could not be started or failed
+    """
+    command = ' '.join(args)
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except OSError as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Error running 'dvc exp list': {e.stderr or str(e)}"
+            detail=f"Error running '{command}': {str(e)}"
         )
-    except Exception as e:
+    # Drain stderr concurrently so the command never blocks on a full pipe
+    stderr_task = asyncio.ensure_future(proc.stderr.read())
+    
+    try:
+        try:
+            async for item in consume(proc.stdout):
+                yield item
+        except Exception:
+            # A failed run leaves truncated output; report its error instead
+            if not proc.stdout.at_eof() or not await proc.wait():
+                raise
+        returncode = await proc.wait()
+    finally:
+        # Don't leave the child running if the caller stops early
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+    
+    stderr = (await stderr_task).decode('utf-8', 'replace')
+    if returncode:
         raise HTTPException(
             status_code=500,
-            detail=f"Error parsing experiments: {str(e)}"
+            detail=f"Error running '{command}': {stderr.strip() or f'exit status {returncode}'}"
         )
 
 
-def get_experiment_params(commit_hash: str) -> Optional[Dict]:
+def exp_state_entry(state) -> Dict:
     """
-    Get params data for a specific experiment using 'dvc exp show --json'.
+    Convert a DVC ExpState into the revision layout of 'dvc exp show --json'.
+    
+    Only the fields used here are copied, so both sources can be read the
+    same way.
     
     Args:
-        commit_hash: The commit hash of the experiment
+        state: ExpState returned by Repo.experiments.show()
         
     Returns:
-        dict: Parameters from dvclive/params.yaml or params.yaml as fallback
+        dict: Revision entry with 'rev' and 'data' keys
     """
-    try:
-        result = subprocess.run(
-            ['dvc', 'exp', 'show', '--json'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+    return {
+        'rev': state.rev,
+        'data': {'params': state.data.params if state.data else {}}
+    }
+
+
+def has_repo() -> bool:
+    """Check whether the shared DVC repository opened at startup is available."""
+    return getattr(app.state, 'repo', None) is not None
+
+
+async def run_repo(func, *args, **kwargs):
+    """
+    Run a blocking DVC Python API call on the shared repository.
+    
+    Calls run on a single worker thread, so they don't block the event loop
+    and stay serialized (a Repo instance is not thread-safe) even when a
+    caller is cancelled while its call is still running.
+    
+    Args:
+        func: Function taking the Repo as its first argument
+        *args, **kwargs: Further arguments for func
+        
+    Returns:
+        The return value of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        app.state.repo_executor,
+        functools.partial(func, app.state.repo, *args, **kwargs)
+    )
+
+
+def repo_exp_list(repo) -> List[tuple]:
+    """
+    Get list of DVC experiments through the DVC Python API.
+    
+    Args:
+        repo: DVC Repo instance
+        
+    Returns:
+        list: List of tuples (commit_hash, experiment_name)
+    """
+    exps = repo.experiments.ls()
+    
+    # Use the same short hashes as 'dvc exp list'
+    return [
+        (exp_rev[:7], exp_name)
+        for baseline_exps in exps.values()
+        for exp_name, exp_rev in baseline_exps
+        if exp_rev
+    ]
+
+
+def repo_git_revs(repo) -> List[str]:
+    """
+    Get git HEAD and the experiment ref commits through the repository's scm.
+    
+    Args:
+        repo: DVC Repo instance
+        
+    Returns:
+        list: HEAD commit followed by the commit of every refs/exps ref,
+        like 'git rev-parse HEAD --glob=refs/exps'
+    """
+    scm = repo.scm
+    return [scm.get_rev(), *(scm.get_ref(ref) for ref in sorted(scm.iter_refs(base='refs/exps/')))]
+
+
+def parse_exp_list_line(line: str) -> Optional[tuple]:
+    """
+    Parse one line of 'dvc exp list' output.
+    
+    Args:
+        line: Output line like "ded11c0 [addle-hill]"
+        
+    Returns:
+        tuple: (commit_hash, experiment_name), or None for other lines
+    """
+    line = line.strip()
+    if not line or line.startswith('main:'):
+        return None
+    
+    parts = line.split(None, 1)
+    if len(parts) == 2 and parts[1].startswith('[') and parts[1].endswith(']'):
+        return parts[0], parts[1][1:-1]
+    return None
+
+
+async def iter_experiments():
+    """
+    Yield DVC experiments from the shared repository or 'dvc exp list'.
+    
+    The shared DVC repository is used when it could be opened at startup,
+    which avoids starting a new dvc process for every call. Otherwise
+    experiments are yielded as the command prints them.
+    
+    Yields:
+        tuple: (commit_hash, experiment_name)
+    """
+    if has_repo():
+        try:
+            experiments = await run_repo(repo_exp_list)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error listing experiments: {str(e)}"
+            )
+        for experiment in experiments:
+            yield experiment
+        return
+    
+    async def parse_lines(stdout):
+        async for line in stdout:
+            experiment = parse_exp_list_line(line.decode())
+            if experiment:
+                yield experiment
+    
+    async with _DVC_LOCK:
+        async for experiment in stream_command(('dvc', 'exp', 'list'), parse_lines):
+            yield experiment
+
+
+async def get_experiments_list() -> List[tuple]:
+    """
+    Get list of DVC experiments from the shared repository or 'dvc exp list'.
+    
+    Returns:
+        list: List of tuples (commit_hash, experiment_name)
+    """
+    return [experiment async for experiment in iter_experiments()]
+
+
+def invalidate_exp_list_cache() -> None:
+    """Drop the cached 'dvc exp list' result so the next lookup re-runs DVC."""
+    global _EXP_LIST_CACHE
+    _EXP_LIST_CACHE = (0, None, {}, {})
+
+
+def cached_experiments_list() -> Optional[Tuple[float, List[tuple], Dict[str, tuple], Dict[str, tuple]]]:
+    """
+    Get the cached experiment list if it is still valid.
+    
+    Returns:
+        tuple: (timestamp, experiments, by_name, by_hash), or None if stale
+    """
+    ts, experiments, _, _ = _EXP_LIST_CACHE
+    if experiments is not None and time.monotonic() - ts < EXP_LIST_CACHE_TTL:
+        return _EXP_LIST_CACHE
+    return None
+
+
+def cache_experiments_list(
+    experiments: List[tuple], ts: float
+) -> Tuple[float, List[tuple], Dict[str, tuple], Dict[str, tuple]]:
+    """
+    Store the experiment list together with name and hash lookup tables.
+    
+    Args:
+        experiments: List of tuples (commit_hash, experiment_name)
+        ts: time.monotonic() from before the list was loaded
         
-        data = json.loads(result.stdout)
+    Returns:
+        tuple: (timestamp, experiments, by_name, by_hash) where both lookup
+        tables map to (commit_hash, experiment_name) tuples
+    """
+    global _EXP_LIST_CACHE
+    by_name = {exp_name: (ch, exp_name) for ch, exp_name in experiments}
+    by_hash = {ch: (ch, exp_name) for ch, exp_name in experiments}
+    
+    _EXP_LIST_CACHE = (ts, experiments, by_name, by_hash)
+    return _EXP_LIST_CACHE
+
+
+async def load_experiments_list() -> Tuple[float, List[tuple], Dict[str, tuple], Dict[str, tuple]]:
+    """
+    Get the experiment list together with name and hash lookup tables.
+    
+    The result is cached for EXP_LIST_CACHE_TTL seconds.
+    
+    Returns:
+        tuple: (timestamp, experiments, by_name, by_hash) where both lookup
+        tables map to (commit_hash, experiment_name) tuples
+    """
+    async with _EXP_LIST_LOCK:
+        cached = cached_experiments_list()
+        if cached is not None:
+            return cached
         
-        # Search for the experiment in the JSON data
-        for item in data:
-            # Check if this is the main branch with experiments
-            if 'experiments' in item and item['experiments']:
-                for exp in item['experiments']:
-                    if 'revs' in exp and exp['revs']:
-                        for rev in exp['revs']:
-                            # Check if the commit hash matches (full or short)
-                            rev_hash = rev.get('rev', '')
-                            if commit_hash in rev_hash or rev_hash.startswith(commit_hash):
-                                params_data = rev.get('data', {}).get('params', {})
-                                
-                                # Try to get dvclive/params.yaml first
-                                if 'dvclive/params.yaml' in params_data:
-                                    dvclive_params = params_data['dvclive/params.yaml']
-                                    if 'data' in dvclive_params and 'error' not in dvclive_params:
-                                        return dvclive_params['data']
-                                
-                                # Fall back to params.yaml if dvclive/params.yaml not available
-                                if 'params.yaml' in params_data:
-                                    params_yaml = params_data['params.yaml']
-                                    if 'data' in params_yaml:
-                                        return params_yaml['data']
+        now = time.monotonic()
+        return cache_experiments_list(await get_experiments_list(), now)
+
+
+async def resolve_experiment(experiment_id: str) -> Optional[tuple]:
+    """
+    Resolve an experiment name or commit hash (prefix) to an experiment.
+    
+    Args:
+        experiment_id: Experiment name, commit hash or commit hash prefix
         
+    Returns:
+        tuple: (commit_hash, experiment_name), or None if not found
+    """
+    _, experiments, by_name, by_hash = await load_experiments_list()
+    
+    # Try to find experiment by name first, then by commit hash
+    found = by_name.get(experiment_id) or by_hash.get(experiment_id)
+    if found:
+        return found
+    
+    return next(
+        ((ch, exp_name) for ch, exp_name in experiments if ch.startswith(experiment_id)),
+        None
+    )
+
+
+async def get_git_head() -> Optional[str]:
+    """
+    Get the current git HEAD commit from the shared repository's scm, or
+    with 'git rev-parse HEAD' when it is not available.
+    
+    Returns:
+        str: HEAD commit sha, or None if it could not be determined
+    """
+    if has_repo():
+        try:
+            return await run_repo(lambda repo: repo.scm.get_rev())
+        except Exception:
+            return None
+    
+    try:
+        returncode, stdout, _ = await run_command('git', 'rev-parse', 'HEAD')
+    except OSError:
         return None
+    return stdout.strip() if returncode == 0 else None
+
+
+async def get_etag() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Compute an ETag for the experiment data of the repository.
+    
+    The tag changes whenever git HEAD, any experiment ref or dvc.lock changes,
+    which covers new, removed and applied experiments.
+    
+    Returns:
+        tuple: (etag, head) with the quoted ETag and the git HEAD commit,
+        both None if git could not be queried
+    """
+    if has_repo():
+        # Read the refs through the shared repository instead of spawning git
+        try:
+            revs = await run_repo(repo_git_revs)
+        except Exception:
+            return None, None
+        root_dir = app.state.repo.root_dir
+    else:
+        try:
+            returncode, stdout, _ = await run_command(
+                'git', 'rev-parse', '--show-toplevel', 'HEAD', '--glob=refs/exps'
+            )
+        except OSError:
+            return None, None
+        if returncode:
+            return None, None
+        root_dir, *revs = stdout.splitlines()
+    
+    # The server may run from a subdirectory of the repository
+    try:
+        lock_mtime = str(os.path.getmtime(os.path.join(root_dir, 'dvc.lock')))
+    except OSError:
+        lock_mtime = ''
+    
+    digest = hashlib.sha1('\n'.join(revs).encode() + lock_mtime.encode()).hexdigest()
+    return f'"{digest}"', revs[0]
+
+
+def discard_task(task: Optional[asyncio.Task]) -> None:
+    """
+    Cancel a task whose result is no longer needed.
+    
+    Args:
+        task: Task to cancel, or None
+    """
+    if task is None:
+        return
+    task.cancel()
+    # Mark any exception as retrieved so asyncio does not log it
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+def is_not_modified(request: Request, etag: Optional[str]) -> bool:
+    """
+    Check whether the client's If-None-Match header matches the current ETag.
+    
+    Args:
+        request: Incoming request
+        etag: Current ETag, or None if unknown
+        
+    Returns:
+        bool: True if a 304 Not Modified response can be sent
+    """
+    if etag is None:
+        return False
+    if_none_match = request.headers.get('if-none-match')
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+    return etag in tags or '*' in tags
+
+
+async def iter_exp_show_revs():
+    """
+    Yield experiment revisions from 'dvc exp show --json' output.
+    
+    With the shared DVC repository available the experiment states are read
+    directly. Otherwise, with ijson installed the output is parsed
+    incrementally while DVC writes it, so only one revision is held in memory
+    at a time, or the whole document is loaded with json.
+    
+    Yields:
+        dict: Revision entry with 'rev' and 'data' keys
+    """
+    if has_repo():
+        states = await run_repo(lambda repo: repo.experiments.show())
+        for rev in (
+            rev
+            for state in states
+            for exp in state.experiments or []
+            for rev in exp.revs
+        ):
+            yield exp_state_entry(rev)
+        return
+    
+    if ijson is None:
+        returncode, stdout, stderr = await run_command('dvc', 'exp', 'show', '--json', text=False)
+        if returncode:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error running 'dvc exp show': {stderr.strip() or f'exit status {returncode}'}"
+            )
+        
+        data = load_json(stdout)
+        for rev in (
+            rev
+            for item in data
+            for exp in item.get('experiments') or []
+            for rev in exp.get('revs') or []
+        ):
+            yield rev
+        return
+    
+    revs = stream_command(
+        ('dvc', 'exp', 'show', '--json'),
+        lambda stdout: ijson.items_async(stdout, _EXP_SHOW_REVS_PREFIX, use_float=True)
+    )
+    async for rev in revs:
+        yield rev
+
+
+async def find_exp_show_params(commit_hash: str) -> Optional[Dict]:
+    """
+    Find the params of a revision in the full 'dvc exp show --json' output.
+    
+    Revisions are checked as they are parsed, and DVC is stopped as soon as
+    a match is found.
+    
+    Args:
+        commit_hash: The full or short commit hash of the experiment
         
-    except subprocess.CalledProcessError as e:
+    Returns:
+        dict: Parameters of the first matching revision that has any, or None
+    """
+    revs = iter_exp_show_revs()
+    try:
+        async for rev in revs:
+            # DVC short hashes are prefixes of the full hash; a substring match
+            # could pick up an unrelated revision
+            if rev.get('rev', '').startswith(commit_hash):
+                params = select_params(rev.get('data', {}).get('params', {}))
+                if params:
+                    return params
+        return None
+    except HTTPException:
+        raise
+    except OSError as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Error running 'dvc exp show': {e.stderr or str(e)}"
+            detail=f"Error running 'dvc exp show': {str(e)}"
         )
     except json.JSONDecodeError as e:
         raise HTTPException(
@@ -146,11 +642,175 @@ def get_experiment_params(commit_hash: str) -> Optional[Dict]:
             status_code=500,
             detail=f"Error getting params: {str(e)}"
         )
+    finally:
+        await revs.aclose()
+
+
+def _lookup(index: Dict[str, Optional[Dict]], commit_hash: str) -> Optional[Dict]:
+    """
+    Find the params of a revision by its full or short commit hash.
+    
+    Args:
+        index: Mapping of revision hash -> params
+        commit_hash: The commit hash of the experiment
+        
+    Returns:
+        dict: Parameters of the first matching revision that has any
+    """
+    # DVC short hashes are prefixes of the full hash; a substring match could
+    # pick up an unrelated revision
+    return index.get(commit_hash) or next(
+        (params for rev_hash, params in index.items()
+         if params and rev_hash.startswith(commit_hash)),
+        None
+    )
+
+
+def select_params(params_data: Dict) -> Optional[Dict]:
+    """
+    Pick the params of a revision from its 'dvc exp show' params section.
+    
+    Args:
+        params_data: The 'data.params' section of a revision
+        
+    Returns:
+        dict: Parameters from dvclive/params.yaml or params.yaml as fallback
+    """
+    # Try to get dvclive/params.yaml first
+    if 'dvclive/params.yaml' in params_data:
+        dvclive_params = params_data['dvclive/params.yaml']
+        if 'data' in dvclive_params and 'error' not in dvclive_params:
+            return dvclive_params['data']
+    
+    # Fall back to params.yaml if dvclive/params.yaml not available
+    if 'params.yaml' in params_data:
+        params_yaml = params_data['params.yaml']
+        if 'data' in params_yaml:
+            return params_yaml['data']
+    
+    return None
+
+
+async def load_rev_params(commit_hash: str) -> Optional[Dict]:
+    """
+    Get params data for a single revision only, through the shared repository
+    or 'dvc exp show --json --rev'.
+    
+    Restricting the output to one revision keeps the JSON payload small. Any
+    failure (e.g. a DVC version without these flags) returns None so callers
+    can fall back to scanning the full 'dvc exp show' output.
+    
+    Args:
+        commit_hash: The commit hash of the experiment
+        
+    Returns:
+        dict: Parameters of the revision, or None if unavailable
+    """
+    try:
+        if has_repo():
+            states = await run_repo(lambda repo: repo.experiments.show(revs=[commit_hash], num=1))
+            data = [
+                dict(exp_state_entry(state), experiments=[
+                    {'revs': [exp_state_entry(rev) for rev in exp.revs]}
+                    for exp in state.experiments or []
+                ])
+                for state in states
+            ]
+        else:
+            returncode, stdout, _ = await run_command(
+                'dvc', 'exp', 'show', '--json', '--rev', commit_hash, '--num', '1', text=False
+            )
+            if returncode:
+                return None
+            data = load_json(stdout)
+        
+        # The requested revision is listed as a baseline, not as an experiment
+        index = {
+            rev.get('rev', ''): select_params(rev.get('data', {}).get('params', {}))
+            for item in data
+            for rev in [item, *(
+                exp_rev
+                for exp in item.get('experiments') or []
+                for exp_rev in exp.get('revs') or []
+            )]
+        }
+        return _lookup(index, commit_hash)
+        
+    except Exception:
+        return None
+
+
+async def get_experiment_params(commit_hash: str, head: Optional[str] = None) -> Optional[Dict]:
+    """
+    Get params data for a specific experiment.
+    
+    Results are kept in an LRU cache per (commit_hash, git HEAD). On a miss
+    only the requested revision is loaded, falling back to scanning the full
+    'dvc exp show' output.
+    
+    Args:
+        commit_hash: The commit hash of the experiment
+        head: Current git HEAD commit, looked up if not given
+        
+    Returns:
+        dict: Parameters from dvclive/params.yaml or params.yaml as fallback
+    """
+    if head is None:
+        head = await get_git_head()
+    
+    # An experiment's params cannot change while HEAD stays the same
+    key = (commit_hash, head)
+    if head is not None and key in _PARAMS_CACHE:
+        _PARAMS_CACHE.move_to_end(key)
+        return _PARAMS_CACHE[key]
+    
+    # Ask DVC for this revision only before loading every experiment
+    params = await load_rev_params(commit_hash)
+    if not params:
+        params = await find_exp_show_params(commit_hash)
+    
+    if params:
+        cache_params(commit_hash, head, params)
+    return params
 
 
-def apply_experiment(experiment_name: str) -> Dict[str, str]:
+def cache_params(commit_hash: str, head: Optional[str], params: Dict) -> None:
     """
-    Apply a DVC experiment using 'dvc exp apply' command.
+    Store the params of a known experiment in the LRU cache.
+    
+    Args:
+        commit_hash: The commit hash of the experiment
+        head: Current git HEAD commit; nothing is cached if it is unknown
+        params: Parameters of the experiment
+    """
+    if head is None:
+        return
+    _PARAMS_CACHE[(commit_hash, head)] = params
+    if len(_PARAMS_CACHE) > PARAMS_CACHE_SIZE:
+        _PARAMS_CACHE.popitem(last=False)
+
+
+def apply_error(experiment_name: str, error_msg: str, unknown: bool) -> HTTPException:
+    """
+    Build the HTTP error for a failed 'dvc exp apply'.
+    
+    Args:
+        experiment_name: Name or commit hash of the experiment
+        error_msg: Error reported by DVC
+        unknown: Whether DVC reported the experiment as unknown
+        
+    Returns:
+        HTTPException: 404 for unknown experiments, 400 otherwise
+    """
+    return HTTPException(
+        status_code=404 if unknown else 400,
+        detail=f"Error applying experiment '{experiment_name}': {error_msg}"
+    )
+
+
+async def apply_experiment(experiment_name: str) -> Dict[str, str]:
+    """
+    Apply a DVC experiment through the shared repository or 'dvc exp apply'.
     
     Args:
         experiment_name: Name or commit hash of the experiment to apply
@@ -159,25 +819,36 @@ def apply_experiment(experiment_name: str) -> Dict[str, str]:
         dict: Response with success status and message
     """
     try:
-        result = subprocess.run(
-            ['dvc', 'exp', 'apply', experiment_name],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        if has_repo():
+            try:
+                await run_repo(lambda repo: repo.experiments.apply(experiment_name))
+            except (InvalidExpRevError, UnresolvedExpNamesError) as e:
+                raise apply_error(experiment_name, str(e), unknown=True)
+            except DvcException as e:
+                raise apply_error(experiment_name, str(e), unknown=False)
+            # Same message as 'dvc exp apply' prints
+            message = f"Changes for experiment '{experiment_name}' have been applied to your current workspace."
+        else:
+            async with _DVC_LOCK:
+                returncode, stdout, stderr = await run_command('dvc', 'exp', 'apply', experiment_name)
+            if returncode:
+                error_msg = stderr.strip() or f"exit status {returncode}"
+                unknown = any(text in error_msg for text in _UNKNOWN_EXPERIMENT_ERRORS)
+                raise apply_error(experiment_name, error_msg, unknown)
+            message = stdout.strip() or f"Experiment '{experiment_name}' applied successfully"
+        
+        # Applying changes the workspace, so cached results may no longer be valid
+        invalidate_exp_list_cache()
+        _PARAMS_CACHE.clear()
         
         return {
             "success": True,
-            "message": result.stdout.strip() or f"Experiment '{experiment_name}' applied successfully",
+            "message": message,
             "experiment_name": experiment_name
         }
         
-    except subprocess.CalledProcessError as e:
-        error_msg = e.stderr.strip() if e.stderr else str(e)
-        raise HTTPException(
-            status_code=400,
-            detail=f"Error applying experiment '{experiment_name}': {error_msg}"
-        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -200,26 +871,66 @@ async def root():
 
 
 @app.get("/experiments", response_model=List[ExperimentInfo])
-async def list_experiments():
+async def list_experiments(request: Request):
     """
     Get list of all DVC experiments.
     
     Returns:
         List of experiment information (commit hash and name)
     """
-    experiments = get_experiments_list()
+    etag, _ = await get_etag()
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
     
-    return [
-        ExperimentInfo(
-            commit_hash=commit_hash,
-            experiment_name=exp_name
-        )
-        for commit_hash, exp_name in experiments
-    ]
+    headers = {"ETag": etag} if etag else None
+    
+    # Both fields are plain strings from DVC, so the rows are serialized
+    # directly instead of being validated as ExperimentInfo
+    if has_repo() or cached_experiments_list() is not None:
+        # The Repo API returns the whole list at once, so there is nothing to
+        # gain from streaming and any error can still become an HTTP error
+        _, experiments, _, _ = await load_experiments_list()
+        content = dump_json([
+            {"commit_hash": commit_hash, "experiment_name": exp_name}
+            for commit_hash, exp_name in experiments
+        ])
+        return Response(content=content, media_type="application/json", headers=headers)
+    
+    now = time.monotonic()
+    experiments = iter_experiments()
+    
+    # Fetch the first experiment up front so DVC errors still become HTTP errors.
+    # A failure after that can only end the stream early: the 200 status has
+    # already been sent, so the client gets a truncated array.
+    try:
+        first = await experiments.__anext__()
+    except StopAsyncIteration:
+        first = None
+    
+    async def stream_json_array():
+        rows = []
+        try:
+            yield b'['
+            if first is not None:
+                rows.append(first)
+                commit_hash, exp_name = first
+                yield dump_json({"commit_hash": commit_hash, "experiment_name": exp_name})
+                async for commit_hash, exp_name in experiments:
+                    rows.append((commit_hash, exp_name))
+                    yield b',' + dump_json({"commit_hash": commit_hash, "experiment_name": exp_name})
+            yield b']'
+        finally:
+            # Release the dvc process and lock even if the client disconnects
+            await experiments.aclose()
+        
+        # Only a complete list is reused by later requests
+        cache_experiments_list(rows, now)
+    
+    return StreamingResponse(stream_json_array(), media_type="application/json", headers=headers)
 
 
 @app.get("/experiments/{experiment_id}/params", response_model=ExperimentParams)
-async def get_experiment_parameters(experiment_id: str):
+async def get_experiment_parameters(experiment_id: str, request: Request, response: Response):
     """
     Get parameters for a specific experiment.
     
@@ -229,22 +940,48 @@ async def get_experiment_parameters(experiment_id: str):
     Returns:
         Experiment parameters (data_ingestion, feature_engineering, model_building)
     """
-    # Try to find experiment by name first, then by commit hash
-    experiments = get_experiments_list()
+    etag, head = await get_etag()
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
     
-    commit_hash = None
-    for ch, exp_name in experiments:
-        if experiment_id == exp_name or experiment_id == ch or ch.startswith(experiment_id):
-            commit_hash = ch
-            break
+    # An id that looks like a commit hash can be looked up while the
+    # experiment list is still loading. Repo calls run one at a time, so
+    # there is nothing to overlap when the shared repository is in use.
+    params_task = None
+    if (
+        not has_repo()
+        and set(experiment_id) <= _HEX_DIGITS
+        and (experiment_id, head) not in _PARAMS_CACHE
+    ):
+        params_task = asyncio.create_task(load_rev_params(experiment_id))
     
-    if not commit_hash:
+    try:
+        experiment = await resolve_experiment(experiment_id)
+    except BaseException:
+        discard_task(params_task)
+        raise
+    
+    if not experiment:
+        discard_task(params_task)
         raise HTTPException(
             status_code=404,
             detail=f"Experiment '{experiment_id}' not found"
         )
     
-    params = get_experiment_params(commit_hash)
+    commit_hash = experiment[0]
+    
+    # The speculative lookup is only valid for an exact hash match; a shorter
+    # prefix may belong to several experiments
+    if params_task is not None and commit_hash == experiment_id:
+        # Only cache the result once the id is known to be an experiment
+        params = await params_task
+        if params:
+            cache_params(commit_hash, head, params)
+        else:
+            params = await get_experiment_params(commit_hash, head)
+    else:
+        discard_task(params_task)
+        params = await get_experiment_params(commit_hash, head)
     
     if not params:
         raise HTTPException(
@@ -252,6 +989,9 @@ async def get_experiment_parameters(experiment_id: str):
             detail=f"Parameters not found for experiment '{experiment_id}'"
         )
     
+    if etag:
+        response.headers["ETag"] = etag
+    
     # Format the response
     return ExperimentParams(
         data_ingestion=params.get('data_ingestion', {}),
@@ -271,24 +1011,18 @@ async def apply_experiment_endpoint(experiment_id: str):
     Returns:
         Response indicating success or failure
     """
-    # Verify experiment exists
-    experiments = get_experiments_list()
-    experiment_found = False
-    
-    for commit_hash, exp_name in experiments:
-        if experiment_id == exp_name or experiment_id == commit_hash or commit_hash.startswith(experiment_id):
-            experiment_found = True
-            # Use the experiment name for applying (DVC prefers names)
-            experiment_name = exp_name
-            break
+    # 'dvc exp apply' accepts any git revision, so only apply known experiments
+    experiment = await resolve_experiment(experiment_id)
     
-    if not experiment_found:
+    if not experiment:
         raise HTTPException(
             status_code=404,
             detail=f"Experiment '{experiment_id}' not found"
         )
     
-    result = apply_experiment(experiment_name)
+    # Use the experiment name for applying (DVC prefers names)
+    experiment_name = experiment[1]
+    result = await apply_experiment(experiment_name)
     return ApplyExperimentResponse(**result)
 
 
@@ -6,16 +6,70 @@ Python script to list DVC experiments and extract dvclive/params.yaml data for e
 import subprocess
 import sys
 import json
-import re
 
+try:
+    from dvc.repo import Repo
+except ImportError:  # pragma: no cover - fall back to the dvc CLI
+    Repo = None
 
-def get_experiments_list():
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# Location of the experiment revisions in 'dvc exp show --json' output
+_EXP_SHOW_REVS_PREFIX = 'item.experiments.item.revs.item'
+
+
+def open_repo():
     """
-    Get list of DVC experiments using 'dvc exp list' command.
+    Open the DVC repository through the DVC Python API.
     
+    Returns:
+        Repo: DVC repository, or None to use the dvc CLI instead
+    """
+    if Repo is None:
+        return None
+    
+    try:
+        return Repo()
+    except Exception as e:
+        print(f"Could not open DVC repository, using the dvc CLI instead: {e}", file=sys.stderr)
+        return None
+
+
+def get_experiments_list(repo=None):
+    """
+    Get list of DVC experiments through the DVC Python API or 'dvc exp list'.
+    
+    Args:
+        repo: DVC repository to query through the Python API, which avoids
+            starting a separate dvc process; None runs the dvc CLI
+        
     Returns:
         list: List of tuples (commit_hash, experiment_name)
     """
+    if repo is not None:
+        try:
+            exps = repo.experiments.ls()
+            
+            # Use the same short hashes as 'dvc exp list'
+            return [
+                (exp_rev[:7], exp_name)
+                for baseline_exps in exps.values()
+                for exp_name, exp_rev in baseline_exps
+                if exp_rev
+            ]
+        except Exception as e:
+            print(f"Error listing experiments: {e}", file=sys.stderr)
+            return []
+    
     try:
         result = subprocess.run(
             ['dvc', 'exp', 'list'],
@@ -25,19 +79,15 @@ def get_experiments_list():
         )
         
         experiments = []
-        lines = result.stdout.strip().split('\n')
-        
-        for line in lines:
+        for line in result.stdout.splitlines():
             line = line.strip()
             if not line or line.startswith('main:'):
                 continue
             
             # Parse lines like: "ded11c0 [addle-hill]"
-            match = re.match(r'(\w+)\s+\[(.+)\]', line)
-            if match:
-                commit_hash = match.group(1)
-                exp_name = match.group(2)
-                experiments.append((commit_hash, exp_name))
+            parts = line.split(None, 1)
+            if len(parts) == 2 and parts[1].startswith('[') and parts[1].endswith(']'):
+                experiments.append((parts[0], parts[1][1:-1]))
         
         return experiments
         
@@ -49,61 +99,178 @@ def get_experiments_list():
         return []
 
 
-def get_experiment_params(commit_hash):
+def select_params(params_data):
     """
-    Get params data for a specific experiment using 'dvc exp show --json'.
+    Pick the params of a revision from its 'dvc exp show' params section.
     
     Args:
-        commit_hash: The commit hash of the experiment
+        params_data: The 'data.params' section of a revision
         
     Returns:
         dict: Parameters from dvclive/params.yaml or params.yaml as fallback
     """
-    try:
+    # Try to get dvclive/params.yaml first
+    if 'dvclive/params.yaml' in params_data:
+        dvclive_params = params_data['dvclive/params.yaml']
+        if 'data' in dvclive_params and 'error' not in dvclive_params:
+            return dvclive_params['data']
+    
+    # Fall back to params.yaml if dvclive/params.yaml not available
+    if 'params.yaml' in params_data:
+        params_yaml = params_data['params.yaml']
+        if 'data' in params_yaml:
+            return params_yaml['data']
+    
+    return None
+
+
+def load_json(data):
+    """
+    Parse JSON bytes, with orjson if it is installed.
+    
+    Args:
+        data: UTF-8 encoded JSON
+        
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def exp_state_entry(state):
+    """
+    Convert a DVC ExpState into the revision layout of 'dvc exp show --json'.
+    
+    Args:
+        state: ExpState returned by Repo.experiments.show()
+        
+    Returns:
+        dict: Revision entry with 'rev' and 'data' keys
+    """
+    return {
+        'rev': state.rev,
+        'data': {'params': state.data.params if state.data else {}}
+    }
+
+
+def iter_exp_show_revs(repo=None):
+    """
+    Yield experiment revisions from 'dvc exp show --json' output.
+    
+    With a DVC repository given the experiment states are read directly.
+    Otherwise, with ijson installed the output is parsed incrementally while
+    DVC writes it, or the whole document is loaded with json.
+    
+    Args:
+        repo: DVC repository to query through the Python API, or None
+        
+    Yields:
+        dict: Revision entry with 'rev' and 'data' keys
+    """
+    if repo is not None:
+        states = repo.experiments.show()
+        
+        yield from (
+            exp_state_entry(rev)
+            for state in states
+            for exp in state.experiments or []
+            for rev in exp.revs
+        )
+        return
+    
+    if ijson is None:
         result = subprocess.run(
             ['dvc', 'exp', 'show', '--json'],
             capture_output=True,
-            text=True,
             check=True
         )
         
-        data = json.loads(result.stdout)
-        
-        # Search for the experiment in the JSON data
-        for item in data:
-            # Check if this is the main branch with experiments
-            if 'experiments' in item and item['experiments']:
-                for exp in item['experiments']:
-                    if 'revs' in exp and exp['revs']:
-                        for rev in exp['revs']:
-                            # Check if the commit hash matches (full or short)
-                            rev_hash = rev.get('rev', '')
-                            if commit_hash in rev_hash or rev_hash.startswith(commit_hash):
-                                params_data = rev.get('data', {}).get('params', {})
-                                
-                                # Try to get dvclive/params.yaml first
-                                if 'dvclive/params.yaml' in params_data:
-                                    dvclive_params = params_data['dvclive/params.yaml']
-                                    if 'data' in dvclive_params and 'error' not in dvclive_params:
-                                        return dvclive_params['data']
-                                
-                                # Fall back to params.yaml if dvclive/params.yaml not available
-                                if 'params.yaml' in params_data:
-                                    params_yaml = params_data['params.yaml']
-                                    if 'data' in params_yaml:
-                                        return params_yaml['data']
+        data = load_json(result.stdout)
+        yield from (
+            rev
+            for item in data
+            for exp in item.get('experiments') or []
+            for rev in exp.get('revs') or []
+        )
+        return
+    
+    # stderr is inherited so DVC errors reach the terminal directly
+    with subprocess.Popen(['dvc', 'exp', 'show', '--json'], stdout=subprocess.PIPE) as proc:
+        try:
+            yield from ijson.items(proc.stdout, _EXP_SHOW_REVS_PREFIX, use_float=True)
+        except ijson.JSONError:
+            # A failed DVC run leaves truncated output; report its exit status instead
+            if not proc.wait():
+                raise
+        finally:
+            if proc.poll() is None:
+                proc.kill()
         
-        return None
+        if proc.wait():
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+
+def _build_index(revs):
+    """
+    Build a revision hash -> params mapping in a single pass over the revisions.
+    
+    Args:
+        revs: Iterable of 'dvc exp show' revision entries
+        
+    Returns:
+        dict: Mapping of revision hash -> params (None if unavailable)
+    """
+    return {
+        rev.get('rev', ''): select_params(rev.get('data', {}).get('params', {}))
+        for rev in revs
+    }
+
+
+def _lookup(index, commit_hash):
+    """
+    Find the params of a revision by its full or short commit hash.
+    
+    Args:
+        index: Mapping built by _build_index
+        commit_hash: The commit hash of the experiment
+        
+    Returns:
+        dict: Parameters of the first matching revision that has any
+    """
+    # DVC short hashes are prefixes of the full hash; a substring match could
+    # pick up an unrelated revision
+    return index.get(commit_hash) or next(
+        (params for rev_hash, params in index.items()
+         if params and rev_hash.startswith(commit_hash)),
+        None
+    )
+
+
+def load_all_params(repo=None):
+    """
+    Get params data for every experiment from a single experiment show, through
+    the DVC Python API or 'dvc exp show --json'.
+    
+    Args:
+        repo: DVC repository to query through the Python API, or None
+        
+    Returns:
+        dict: Mapping of revision hash -> params (None if unavailable)
+    """
+    try:
+        return _build_index(iter_exp_show_revs(repo))
         
     except subprocess.CalledProcessError as e:
         print(f"Error running 'dvc exp show': {e}", file=sys.stderr)
-        return None
+        return {}
     except json.JSONDecodeError as e:
         print(f"Error parsing JSON: {e}", file=sys.stderr)
-        return None
+        return {}
     except Exception as e:
         print(f"Error getting params: {e}", file=sys.stderr)
-        return None
+        return {}
 
 
 def format_params_output(params):
@@ -113,28 +280,26 @@ def format_params_output(params):
     Args:
         params: Dictionary containing the parameters
         
-    Returns:
-        str: Formatted string with parameters
+    Yields:
+        str: Formatted output lines with parameters
     """
     if not params:
-        return "  No parameters available"
+        yield "  No parameters available"
+        return
     
-    output = []
-    output.append("data_ingestion:")
+    yield "data_ingestion:"
     test_size = params.get('data_ingestion', {}).get('test_size', 'N/A')
-    output.append(f"  test_size: {test_size}")
+    yield f"  test_size: {test_size}"
     
-    output.append("feature_engineering:")
+    yield "feature_engineering:"
     max_features = params.get('feature_engineering', {}).get('max_features', 'N/A')
-    output.append(f"  max_features: {max_features}")
+    yield f"  max_features: {max_features}"
     
-    output.append("model_building:")
+    yield "model_building:"
     n_estimators = params.get('model_building', {}).get('n_estimators', 'N/A')
     random_state = params.get('model_building', {}).get('random_state', 'N/A')
-    output.append(f"  n_estimators: {n_estimators}")
-    output.append(f"  random_state: {random_state}")
-    
-    return '\n'.join(output)
+    yield f"  n_estimators: {n_estimators}"
+    yield f"  random_state: {random_state}"
 
 
 def list_dvc_experiments_with_params():
@@ -144,31 +309,45 @@ def list_dvc_experiments_with_params():
     Returns:
         int: Exit code (0 for success, non-zero for failure)
     """
+    # Open the DVC repository once and reuse it for every DVC call
+    repo = open_repo()
+    
     try:
         # Get list of experiments
-        experiments = get_experiments_list()
+        experiments = get_experiments_list(repo)
         
         if not experiments:
             print("No experiments found.", file=sys.stderr)
             return 1
         
+        # Fetch parameters for all experiments at once
+        all_params = load_all_params(repo)
+        
         # Display parameters for each experiment
+        write = sys.stdout.write
         for commit_hash, exp_name in experiments:
-            print(f"\n{'='*60}")
-            print(f"Experiment: {exp_name} ({commit_hash})")
-            print(f"{'='*60}")
+            write(f"\n{'='*60}\n")
+            write(f"Experiment: {exp_name} ({commit_hash})\n")
+            write(f"{'='*60}\n")
             
-            params = get_experiment_params(commit_hash)
+            params = _lookup(all_params, commit_hash)
             if params:
-                print(format_params_output(params))
+                for line in format_params_output(params):
+                    write(line + '\n')
             else:
-                print("  Could not retrieve parameters for this experiment")
+                write("  Could not retrieve parameters for this experiment\n")
+            
+            # Emit each experiment as soon as it is formatted
+            sys.stdout.flush()
         
         return 0
         
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
         return 1
+    finally:
+        if repo is not None:
+            repo.close()
 
 
 if __name__ == "__main__":